@@ -1,19 +1,30 @@
 """Ponto de entrada principal do sistema de verificação de licenciamento."""
 
+import asyncio
 import logging
 import sys
 import time
+from collections.abc import AsyncIterator
 from datetime import datetime
+from itertools import batched
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from dotenv import load_dotenv
 
 from src.config.settings import settings
 from src.sharepoint.client import SharePointClient
-from src.excel.reader import ExcelReader
-from src.excel.writer import ExcelWriter
-from src.agent.search_agent import SearchAgent
-from src.models.software import SoftwareResult
+from src.models.software import Software, SoftwareResult
+
+# Leitor, escritor e agente (openpyxl, langchain) são importados sob demanda em main(),
+# para que os caminhos de falha iniciais não paguem o custo dessas importações
+if TYPE_CHECKING:
+    from src.agent.search_agent import SearchAgent
+
+logger = logging.getLogger(__name__)
+
+# Contador de estatísticas correspondente a cada status verificado
+_STATUS_STATS = {"Sim": "sim", "Não": "nao"}
 
 # Carrega variáveis de ambiente
 load_dotenv()
@@ -36,6 +47,147 @@ def setup_logging():
     )
 
 
+async def _search_all(
+    search_agent: "SearchAgent", softwares: list[Software]
+) -> AsyncIterator[tuple[list[Software], list[SoftwareResult] | Exception]]:
+    """
+    Pesquisa os softwares em lotes concorrentes e entrega cada lote ao concluir.
+
+    Softwares presentes no catálogo local são entregues primeiro, sem pesquisa.
+    Um único event loop atende as requisições pendentes; um semáforo
+    limita quantos lotes aguardam o gateway ao mesmo tempo.
+
+    Args:
+        search_agent: Agente de pesquisa compartilhado entre as tarefas
+        softwares: Softwares a serem pesquisados
+
+    Yields:
+        Tupla com o lote e os resultados da pesquisa ou a exceção ocorrida
+    """
+    # Softwares do catálogo local são resolvidos sem consultar o agente
+    if settings.known_catalog_enabled:
+        from src.agent import known_catalog
+
+        known: list[Software] = []
+        known_results: list[SoftwareResult] = []
+        pending: list[Software] = []
+        for software in softwares:
+            result = known_catalog.lookup(software)
+            if result is None:
+                pending.append(software)
+            else:
+                known.append(software)
+                known_results.append(result)
+
+        if known:
+            logger.info(f"Softwares resolvidos pelo catálogo local: {len(known)}")
+            yield known, known_results
+        softwares = pending
+
+    semaphore = asyncio.Semaphore(settings.concurrency)
+
+    async def search_batch(batch: list[Software]):
+        async with semaphore:
+            try:
+                return batch, await search_agent.search_software_licensing_batch_async(
+                    batch, batch_size=len(batch)
+                )
+            except Exception as e:
+                return batch, e
+
+    tasks = [
+        asyncio.create_task(search_batch(list(batch)))
+        for batch in batched(softwares, settings.batch_size)
+    ]
+    for task in asyncio.as_completed(tasks):
+        yield await task
+
+
+async def _search_and_write(
+    search_agent: "SearchAgent", softwares: list[Software], stats: dict[str, int]
+) -> None:
+    """
+    Pesquisa todos os softwares e grava os resultados no Excel de saída.
+
+    Args:
+        search_agent: Agente de pesquisa
+        softwares: Softwares lidos da planilha, na ordem original
+        stats: Estatísticas do processo, atualizadas no lugar
+    """
+    from src.excel.writer import ExcelWriter
+
+    # Agrupa linhas repetidas para pesquisar cada software uma única vez
+    positions: dict[tuple[str, str], list[int]] = {}
+    unique: list[Software] = []
+    for idx, software in enumerate(softwares):
+        key = software.dedup_key
+        if key not in positions:
+            positions[key] = []
+            unique.append(software)
+        positions[key].append(idx)
+
+    if len(unique) < stats["total"]:
+        logger.info(
+            f"Softwares distintos a pesquisar: {len(unique)} "
+            f"({stats['total'] - len(unique)} linhas repetidas)"
+        )
+
+    # Os resultados são gravados no Excel à medida que ficam prontos; linhas
+    # concluídas fora de ordem aguardam em `results` até chegar a sua vez
+    results: list[SoftwareResult | None] = [None] * stats["total"]
+    next_row = 0
+
+    logger.info(f"Gravando resultados em: {settings.output_path}")
+
+    # Um único cliente HTTP assíncrono, aberto neste event loop, atende todas as pesquisas
+    async with search_agent.async_session():
+        with ExcelWriter(settings.output_path, engine=settings.excel_engine) as writer:
+            async for batch, outcome in _search_all(search_agent, unique):
+                failed = isinstance(outcome, Exception)
+                if failed:
+                    error = outcome
+                    outcome = []
+                    for software in batch:
+                        logger.error(f"  ✗ Erro ao pesquisar {software.nome}: {error}")
+
+                        # Cria resultado de erro
+                        outcome.append(
+                            SoftwareResult.from_software(
+                                software,
+                                status_verificado="Erro",
+                                nivel_confianca=0,
+                                fontes_utilizadas=[],
+                                links_fontes=[],
+                                resumo_pesquisa=f"Erro: {str(error)}",
+                            )
+                        )
+
+                for software, result in zip(batch, outcome):
+                    logger.info(
+                        f"  ✓ {result.nome} {result.versao or ''} | "
+                        f"Status: {result.status_verificado} | "
+                        f"Confiança: {result.nivel_confianca}% | "
+                        f"Fontes: {len(result.fontes_utilizadas)}"
+                    )
+
+                    # Replica o resultado para todas as linhas do mesmo software,
+                    # mantendo a ordem e os dados originais da planilha
+                    for idx in positions[software.dedup_key]:
+                        results[idx] = result.copy_for(softwares[idx])
+                        stats["processados"] += 1
+                        if failed:
+                            stats["erros"] += 1
+
+                        # Atualiza estatísticas
+                        stats[_STATUS_STATS.get(result.status_verificado, "erro_status")] += 1
+
+                # Grava no Excel as linhas já concluídas, na ordem original da planilha
+                while next_row < stats["total"] and results[next_row] is not None:
+                    writer.append(results[next_row])
+                    results[next_row] = None
+                    next_row += 1
+
+
 def main():
     """Função principal que orquestra todo o processo."""
     setup_logging()
@@ -89,6 +241,8 @@ def main():
         logger.info("Etapa 3: Leitura do arquivo Excel")
         logger.info("-" * 80)
 
+        from src.excel.reader import ExcelReader
+
         excel_reader = ExcelReader(excel_path)
         softwares = excel_reader.read_softwares()
         stats["total"] = len(softwares)
@@ -104,72 +258,20 @@ def main():
         logger.info("Etapa 4: Inicialização do agente de pesquisa")
         logger.info("-" * 80)
 
+        from src.agent.search_agent import SearchAgent
+
         search_agent = SearchAgent()
         logger.info("Agente de pesquisa inicializado com sucesso")
 
-        # 6. Loop de pesquisa
+        # 6. Loop de pesquisa, com gravação incremental do Excel de saída
         logger.info("\n" + "-" * 80)
-        logger.info("Etapa 5: Pesquisa de licenciamento")
+        logger.info("Etapa 5: Pesquisa de licenciamento e geração do arquivo Excel de saída")
         logger.info("-" * 80)
         logger.info(f"Iniciando pesquisa para {stats['total']} softwares...\n")
 
-        results: list[SoftwareResult] = []
-
-        for idx, software in enumerate(softwares, 1):
-            logger.info(f"[{idx}/{stats['total']}] Pesquisando: {software.nome} {software.versao or ''}")
-
-            try:
-                result = search_agent.search_software_licensing(software)
-                results.append(result)
-                stats["processados"] += 1
-
-                # Atualiza estatísticas
-                status = result.status_verificado.upper()
-                if status == "SIM":
-                    stats["sim"] += 1
-                elif status in ["NÃO", "NAO"]:
-                    stats["nao"] += 1
-                else:
-                    stats["erro_status"] += 1
-
-                logger.info(
-                    f"  ✓ Status: {result.status_verificado} | "
-                    f"Confiança: {result.nivel_confianca}% | "
-                    f"Fontes: {len(result.fontes_utilizadas)}"
-                )
-
-            except Exception as e:
-                logger.error(f"  ✗ Erro ao pesquisar {software.nome}: {e}")
-                stats["erros"] += 1
-
-                # Cria resultado de erro
-                error_result = SoftwareResult.from_software(
-                    software,
-                    status_verificado="Erro",
-                    nivel_confianca=0,
-                    fontes_utilizadas=[],
-                    links_fontes=[],
-                    resumo_pesquisa=f"Erro: {str(e)}",
-                )
-                results.append(error_result)
-                stats["processados"] += 1
-                stats["erro_status"] += 1
-
-            # Pequena pausa entre requisições para evitar rate limiting
-            if idx < stats["total"]:
-                time.sleep(1)
-
-        # 7. Gerar Excel de saída
-        logger.info("\n" + "-" * 80)
-        logger.info("Etapa 6: Geração do arquivo Excel de saída")
-        logger.info("-" * 80)
-
-        excel_writer = ExcelWriter(settings.output_path)
-        if not excel_writer.write_results(results):
-            logger.error("Falha ao gerar arquivo Excel de saída.")
-            return 1
+        asyncio.run(_search_and_write(search_agent, softwares, stats))
 
-        # 8. Estatísticas finais
+        # 7. Estatísticas finais
         elapsed_time = time.time() - start_time
         logger.info("\n" + "=" * 80)
         logger.info("Processo concluído com sucesso!")
@@ -0,0 +1,110 @@
+"""Cache persistente de resultados de pesquisa de licenciamento."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.models.software import Software, SoftwareResult
+
+logger = logging.getLogger(__name__)
+
+# Campos do resultado armazenados no cache; nome, versão e status original vêm
+# sempre do software da planilha e não são reaproveitados
+_RESULT_FIELDS = tuple(
+    f.name
+    for f in fields(SoftwareResult)
+    if f.init and f.name not in {"nome", "versao", "status_original"}
+)
+
+
+class ResultCache:
+    """Cache em SQLite de resultados de pesquisa, indexado por software, versão e modelo."""
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int, model: str):
+        """
+        Inicializa o cache e cria a tabela se necessário.
+
+        Args:
+            cache_dir: Diretório onde o banco SQLite é armazenado
+            ttl_seconds: Tempo de validade de cada entrada em segundos
+            model: Modelo LLM usado nas pesquisas (faz parte da chave)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.model = model
+        self._lock = threading.Lock()
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(cache_dir / "search_cache.sqlite3", check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def key_for(self, software: Software) -> str:
+        """
+        Calcula a chave do cache para um software.
+
+        Args:
+            software: Software a ser pesquisado
+
+        Returns:
+            Hash SHA-1 de nome, versão e modelo
+        """
+        nome, versao = software.dedup_key
+        raw = f"{nome}|{versao}|{self.model}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, software: Software) -> Optional[SoftwareResult]:
+        """
+        Busca um resultado válido no cache.
+
+        Args:
+            software: Software a ser pesquisado
+
+        Returns:
+            SoftwareResult reconstruído a partir do cache ou None se não houver entrada válida
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM results WHERE key = ? AND expires_at > ?",
+                (self.key_for(software), time.time()),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        # As entradas foram gravadas por `set` a partir de resultados já validados,
+        # então são reconstruídas diretamente, sem passar por `from_raw`
+        try:
+            data = json.loads(row[0])
+            data["data_pesquisa"] = datetime.fromisoformat(data["data_pesquisa"])
+            return SoftwareResult.from_software(software, **data)
+        except Exception as e:
+            logger.warning(f"Entrada de cache inválida para {software.nome}: {e}")
+            return None
+
+    def set(self, software: Software, result: SoftwareResult) -> None:
+        """
+        Armazena um resultado no cache.
+
+        Args:
+            software: Software pesquisado
+            result: Resultado da pesquisa
+        """
+        data = {name: getattr(result, name) for name in _RESULT_FIELDS}
+        data["data_pesquisa"] = result.data_pesquisa.isoformat()
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, payload, expires_at) VALUES (?, ?, ?)",
+                (self.key_for(software), payload, time.time() + self.ttl_seconds),
+            )
+            self._conn.commit()
@@ -0,0 +1,199 @@
+"""Catálogo local de softwares com licenciamento conhecido e estável."""
+
+from typing import Optional
+
+from src.models.software import Software, SoftwareResult
+
+# Nome normalizado -> (status, confiança, fontes, links, resumo)
+# Apenas softwares cujo licenciamento não depende da versão e raramente muda.
+KNOWN: dict[str, tuple[str, int, list[str], list[str], str]] = {
+    "microsoft office": (
+        "Sim",
+        95,
+        ["Microsoft Licensing"],
+        ["https://www.microsoft.com/licensing"],
+        "Suíte proprietária; o uso corporativo exige licenciamento por volume ou assinatura Microsoft 365.",
+    ),
+    "microsoft 365": (
+        "Sim",
+        95,
+        ["Microsoft Licensing"],
+        ["https://www.microsoft.com/licensing"],
+        "Serviço por assinatura; exige licença por usuário para uso corporativo.",
+    ),
+    "windows": (
+        "Sim",
+        95,
+        ["Microsoft Licensing"],
+        ["https://www.microsoft.com/licensing"],
+        "Sistema operacional proprietário; o uso corporativo exige licenças OEM ou por volume.",
+    ),
+    "visual studio": (
+        "Sim",
+        90,
+        ["Microsoft Visual Studio License Terms"],
+        ["https://visualstudio.microsoft.com/license-terms/"],
+        "A edição Community não é permitida para organizações de grande porte; "
+        "exige edições Professional ou Enterprise licenciadas.",
+    ),
+    "visual studio code": (
+        "Não",
+        90,
+        ["Visual Studio Code License"],
+        ["https://code.visualstudio.com/license"],
+        "Editor gratuito, com uso comercial permitido pela licença da Microsoft.",
+    ),
+    "docker desktop": (
+        "Sim",
+        90,
+        ["Docker Subscription Service Agreement"],
+        ["https://docs.docker.com/subscription/desktop-license/"],
+        "Empresas com mais de 250 funcionários ou US$ 10 milhões de receita anual "
+        "precisam de assinatura paga.",
+    ),
+    "oracle java se": (
+        "Sim",
+        90,
+        ["Oracle Java SE Subscription"],
+        ["https://www.oracle.com/java/java-se-subscription/"],
+        "O uso comercial do Oracle Java SE exige assinatura por funcionário.",
+    ),
+    "anaconda": (
+        "Sim",
+        85,
+        ["Anaconda Terms of Service"],
+        ["https://www.anaconda.com/legal/terms/terms-of-service"],
+        "Organizações com mais de 200 funcionários precisam de licença paga "
+        "para usar a distribuição e os repositórios da Anaconda.",
+    ),
+    "winrar": (
+        "Sim",
+        90,
+        ["RARLAB"],
+        ["https://www.win-rar.com/"],
+        "Shareware; o uso após o período de avaliação e o uso corporativo exigem licença.",
+    ),
+    "google chrome": (
+        "Não",
+        90,
+        ["Chrome Enterprise"],
+        ["https://chromeenterprise.google/"],
+        "Navegador gratuito, inclusive para implantação e gerenciamento corporativo.",
+    ),
+    "mozilla firefox": (
+        "Não",
+        95,
+        ["Mozilla Public License 2.0"],
+        ["https://www.mozilla.org/MPL/2.0/"],
+        "Software livre sob a MPL 2.0, sem custo de licenciamento.",
+    ),
+    "python": (
+        "Não",
+        95,
+        ["Python Software Foundation License"],
+        ["https://docs.python.org/3/license.html"],
+        "Open-source sob a licença PSF, compatível com uso comercial.",
+    ),
+    "git": (
+        "Não",
+        95,
+        ["Git - GPLv2"],
+        ["https://git-scm.com/about/free-and-open-source"],
+        "Software livre sob a GPLv2, sem custo de licenciamento.",
+    ),
+    "7-zip": (
+        "Não",
+        95,
+        ["7-Zip License"],
+        ["https://www.7-zip.org/license.txt"],
+        "Software livre (GNU LGPL), com uso comercial permitido.",
+    ),
+    "notepad++": (
+        "Não",
+        95,
+        ["Notepad++ - GPL"],
+        ["https://notepad-plus-plus.org/"],
+        "Software livre sob a GPL, sem custo de licenciamento.",
+    ),
+    "putty": (
+        "Não",
+        95,
+        ["PuTTY Licence (MIT)"],
+        ["https://www.chiark.greenend.org.uk/~sgtatham/putty/licence.html"],
+        "Software livre sob licença MIT.",
+    ),
+    "libreoffice": (
+        "Não",
+        95,
+        ["LibreOffice Licenses"],
+        ["https://www.libreoffice.org/about-us/licenses/"],
+        "Suíte livre sob a MPL 2.0, sem custo de licenciamento.",
+    ),
+    "vlc media player": (
+        "Não",
+        95,
+        ["VideoLAN Legal"],
+        ["https://www.videolan.org/legal.html"],
+        "Software livre sob a GPLv2, sem custo de licenciamento.",
+    ),
+    "node.js": (
+        "Não",
+        95,
+        ["Node.js License (MIT)"],
+        ["https://github.com/nodejs/node/blob/main/LICENSE"],
+        "Open-source sob licença MIT.",
+    ),
+    "postgresql": (
+        "Não",
+        95,
+        ["PostgreSQL License"],
+        ["https://www.postgresql.org/about/licence/"],
+        "Open-source sob a licença PostgreSQL, compatível com uso comercial.",
+    ),
+}
+
+# Nomes alternativos comuns nas planilhas de inventário
+_ALIASES: dict[str, str] = {
+    "office": "microsoft office",
+    "ms office": "microsoft office",
+    "office 365": "microsoft 365",
+    "microsoft windows": "windows",
+    "windows 10": "windows",
+    "windows 11": "windows",
+    "vs code": "visual studio code",
+    "vscode": "visual studio code",
+    "chrome": "google chrome",
+    "firefox": "mozilla firefox",
+    "7zip": "7-zip",
+    "notepad plus plus": "notepad++",
+    "vlc": "vlc media player",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "postgres": "postgresql",
+}
+
+
+def lookup(software: Software) -> Optional[SoftwareResult]:
+    """
+    Resolve o licenciamento de um software pelo catálogo local, sem pesquisa web.
+
+    Args:
+        software: Software a ser verificado
+
+    Returns:
+        SoftwareResult com os dados do catálogo ou None se o software não for conhecido
+    """
+    nome, _ = software.dedup_key
+    entry = KNOWN.get(_ALIASES.get(nome, nome))
+    if entry is None:
+        return None
+
+    status, confianca, fontes, links, resumo = entry
+    return SoftwareResult.from_software(
+        software,
+        status_verificado=status,
+        nivel_confianca=confianca,
+        fontes_utilizadas=list(fontes),
+        links_fontes=list(links),
+        resumo_pesquisa=f"{resumo} (Fonte: catálogo local de softwares conhecidos)",
+    )
@@ -1,59 +1,88 @@
 """Prompts para o agente de pesquisa de licenciamento."""
 
-from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
+from src.models.software import Software
 
-def get_search_prompt_template() -> ChatPromptTemplate:
-    """
-    Retorna o template de prompt para pesquisa de licenciamento.
 
-    Returns:
-        Template de prompt do LangChain
-    """
-    system_message = """Você é um assistente especializado em verificar o status de licenciamento de softwares corporativos.
+# Mensagem de sistema, enviada sem alterações em todas as pesquisas
+SYSTEM_MESSAGE = """Você é um assistente especializado em verificar o status de licenciamento de softwares corporativos.
 
-Sua tarefa é pesquisar na web informações atualizadas sobre se um software específico requer licenciamento para uso corporativo/comercial.
+Sua tarefa é pesquisar na web informações atualizadas sobre se cada software de uma lista numerada requer licenciamento para uso corporativo/comercial.
 
 INSTRUÇÕES:
-1. Pesquise informações atualizadas e confiáveis sobre o software e sua versão
+1. Pesquise informações atualizadas e confiáveis sobre cada software e sua versão
 2. Verifique se o software requer licenciamento para uso corporativo/comercial
 3. Identifique fontes oficiais (site do desenvolvedor, documentação oficial, termos de licença)
 4. Analise se há versões gratuitas vs. pagas, licenças open-source vs. proprietárias
 5. Considere o contexto de uso em uma instituição financeira (banco) com cerca de 8 mil funcionários
 
 FORMATO DE RESPOSTA (JSON):
-{{
-    "status_licenciamento": "Sim" ou "Não",
-    "nivel_confianca": número de 0 a 100,
-    "fontes": ["fonte1", "fonte2", ...],
-    "links": ["https://link1.com", "https://link2.com", ...],
-    "resumo": "Breve resumo da pesquisa e conclusão"
-}}
+{
+    "results": [
+        {
+            "index": número do software na lista,
+            "status_licenciamento": "Sim" ou "Não",
+            "nivel_confianca": número de 0 a 100,
+            "fontes": ["fonte1", "fonte2", ...],
+            "links": ["https://link1.com", "https://link2.com", ...],
+            "resumo": "Breve resumo da pesquisa e conclusão"
+        },
+        ...
+    ]
+}
 
 CRITÉRIOS:
 - "Sim" se o software REQUER licenciamento para uso corporativo
 - "Não" se o software é gratuito, open-source sem restrições, ou não requer licenciamento
 - Nível de confiança baseado na qualidade e quantidade de fontes encontradas
 - Priorize fontes oficiais e documentação do desenvolvedor
+- Retorne exatamente um item em "results" para cada software da lista, usando o mesmo número
+- Responda SOMENTE com o objeto JSON, sem blocos de markdown e sem texto antes ou depois
 """
 
-    human_template = """Pesquise informações sobre o seguinte software:
+# Mensagem do usuário; apenas a lista de softwares muda entre as pesquisas
+HUMAN_TEMPLATE = """Pesquise informações sobre os seguintes softwares:
 
-Nome: {nome}
-Versão: {versao}
+{softwares_list}
 
-Determine se este software requer licenciamento para uso corporativo em uma instituição financeira.
+Determine se cada software requer licenciamento para uso corporativo em uma instituição financeira.
 Retorne a resposta no formato JSON especificado."""
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_message),
-            ("human", human_template),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ]
-    )
+# Mensagem de sistema pré-construída, reutilizada por todas as pesquisas
+_SYSTEM_MSG = SystemMessage(content=SYSTEM_MESSAGE)
+
 
-    return prompt
+def build_search_messages(softwares: list[Software]) -> list[BaseMessage]:
+    """
+    Monta as mensagens da pesquisa sem passar pela renderização do template.
+
+    Args:
+        softwares: Softwares a serem pesquisados na mesma requisição
+
+    Returns:
+        Mensagens de sistema e do usuário prontas para o agente
+    """
+    return [
+        _SYSTEM_MSG,
+        HumanMessage(content=HUMAN_TEMPLATE.format(softwares_list=format_softwares_list(softwares))),
+    ]
+
+
+def format_softwares_list(softwares: list[Software]) -> str:
+    """
+    Formata a lista numerada de softwares para o prompt.
+
+    Args:
+        softwares: Softwares a serem pesquisados na mesma requisição
+
+    Returns:
+        Lista numerada (a partir de 1) com nome e versão de cada software
+    """
+    return "\n".join(
+        f"{idx}. Nome: {software.nome} | Versão: {software.versao or 'N/A'}"
+        for idx, software in enumerate(softwares, 1)
+    )
 
 
 def create_search_query(nome: str, versao: str | None = None) -> str:
@@ -85,5 +114,4 @@ def format_software_info(nome: str, versao: str | None = None) -> str:
     """
     if versao:
         return f"Software: {nome} (Versão: {versao})"
-    return f"Software: {nome}"
-
+    return f"Software: {nome}"
\ No newline at end of file
@@ -1,21 +1,147 @@
 """Agente de pesquisa com LangChain e DuckDuckGo Search."""
 
+import asyncio
 import json
 import logging
+import random
+import re
 import time
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import batched, islice
+from typing import Any, AsyncIterator, Optional
 
+import httpx
 from langchain_openai import ChatOpenAI
-from langchain_community.tools import DuckDuckGoSearchRun
 from langchain.agents import create_agent
 from langchain_core.runnables import Runnable
 
 from src.config.settings import settings
 from src.models.software import Software, SoftwareResult
-from src.agent.prompts import get_search_prompt_template
+from src.utils.ratelimit import TokenBucket
+from src.agent.cache import ResultCache
+from src.agent.prompts import build_search_messages
 
 logger = logging.getLogger(__name__)
 
+# Padrões usados na extração manual quando a resposta não está em JSON
+_URL_RE = re.compile(r"https?://\S+")
+_STATUS_SIM_RE = re.compile(r"sim|yes|requer", re.IGNORECASE)
+
+# Número máximo de links extraídos manualmente
+_MAX_MANUAL_LINKS = 5
+
+# Valores de "status_licenciamento" interpretados como "Sim"
+_STATUS_YES = frozenset({"sim", "yes", "s"})
+
+# Decodificador reutilizado para localizar o JSON dentro da resposta do agente
+_JSON_DECODER = json.JSONDecoder()
+
+# Espera máxima (em segundos) entre tentativas, antes do jitter
+_MAX_BACKOFF = 10
+
+# Limite de passos do grafo do agente: parte do padrão do langgraph (25) e soma
+# duas buscas por software do lote (cada busca consome um passo do modelo e um da ferramenta)
+_RECURSION_BASE = 25
+_RECURSION_STEPS_PER_SOFTWARE = 4
+
+# Pool de conexões dos clientes HTTP com o gateway
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+
+def _create_llm(
+    base_url: str,
+    api_key: str,
+    model: str,
+    timeout: int,
+    http_client: Optional[httpx.Client] = None,
+    http_async_client: Optional[httpx.AsyncClient] = None,
+) -> ChatOpenAI:
+    """
+    Cria o cliente LLM com os clientes HTTP informados.
+
+    Args:
+        base_url: URL base do gateway LLM
+        api_key: Token de API
+        model: Modelo LLM
+        timeout: Timeout de requisições em segundos
+        http_client: Cliente HTTP para chamadas síncronas
+        http_async_client: Cliente HTTP para chamadas assíncronas
+
+    Returns:
+        ChatOpenAI configurado
+    """
+    return ChatOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        model=model,
+        temperature=0,
+        timeout=timeout,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        # Modo JSON: a resposta final é sempre um objeto JSON válido. Vai em extra_body
+        # porque response_format no payload faz o langchain usar a API de parse, que
+        # recusa ferramentas sem esquema "strict" (como a busca do DuckDuckGo)
+        extra_body={"response_format": {"type": "json_object"}},
+    )
+
+
+def _create_agent(llm: ChatOpenAI) -> Runnable:
+    """
+    Cria o agente LangChain com a ferramenta de busca usando create_agent.
+
+    Args:
+        llm: Cliente LLM usado pelo agente
+
+    Returns:
+        Runnable configurado
+    """
+    # Inicializa a ferramenta de busca (langchain_community é carregado só aqui)
+    from langchain_community.tools import DuckDuckGoSearchRun
+
+    tools = [DuckDuckGoSearchRun()]
+
+    return create_agent(model=llm, tools=tools)
+
+
+@lru_cache(maxsize=8)
+def _build_llm(base_url: str, api_key: str, model: str, timeout: int) -> ChatOpenAI:
+    """
+    Cria o cliente LLM síncrono, reaproveitado por todos os agentes com a mesma configuração.
+
+    O cliente assíncrono não entra neste cache: suas conexões ficam presas ao
+    event loop em que foram abertas (veja `SearchAgent.async_session`).
+
+    Args:
+        base_url: URL base do gateway LLM
+        api_key: Token de API
+        model: Modelo LLM
+        timeout: Timeout de requisições em segundos
+
+    Returns:
+        ChatOpenAI configurado, seguro para uso entre threads
+    """
+    # Cliente HTTP persistente: mantém as conexões TLS com o gateway abertas entre chamadas
+    http_client = httpx.Client(timeout=timeout, limits=_HTTP_LIMITS)
+    return _create_llm(base_url, api_key, model, timeout, http_client=http_client)
+
+
+@lru_cache(maxsize=8)
+def _build_agent(base_url: str, api_key: str, model: str, timeout: int) -> Runnable:
+    """
+    Cria o agente síncrono, reaproveitado por todos os agentes com a mesma configuração.
+
+    Args:
+        base_url: URL base do gateway LLM
+        api_key: Token de API
+        model: Modelo LLM
+        timeout: Timeout de requisições em segundos
+
+    Returns:
+        Runnable configurado
+    """
+    return _create_agent(_build_llm(base_url, api_key, model, timeout))
+
 
 class SearchAgent:
     """Agente de pesquisa para verificação de licenciamento de softwares."""
@@ -44,34 +170,67 @@ class SearchAgent:
         self.timeout = timeout or settings.request_timeout
         self.max_retries = max_retries or settings.max_retries
 
-        # Inicializa o LLM
-        self.llm = ChatOpenAI(
-            base_url=self.base_url,
-            api_key=self.api_key,
-            model=self.model,
-            temperature=0,
-            timeout=self.timeout,
-        )
+        # Inicializa o LLM (instância compartilhada entre agentes com a mesma configuração)
+        self.llm = _build_llm(self.base_url, self.api_key, self.model, self.timeout)
+
+        # Limitador de taxa compartilhado por todas as pesquisas que usam o agente
+        self.rate_limiter = TokenBucket(settings.requests_per_second, settings.burst)
 
-        # Inicializa a ferramenta de busca
-        self.search_tool = DuckDuckGoSearchRun()
+        # Cache persistente de resultados
+        self.cache: Optional[ResultCache] = None
+        if settings.cache_enabled:
+            self.cache = ResultCache(
+                settings.cache_dir,
+                ttl_seconds=settings.cache_ttl_days * 86400,
+                model=self.model,
+            )
 
-        # Template de prompt reutilizável
-        self.prompt = get_search_prompt_template()
+        # Cria o agente; ele não guarda estado entre chamadas (o estado vai em "messages")
+        self.agent = _build_agent(self.base_url, self.api_key, self.model, self.timeout)
 
-        # Cria o agente
-        self.agent = self._create_agent()
+        # Agente das pesquisas assíncronas e seu cliente HTTP, válidos apenas
+        # enquanto houver alguma `async_session` aberta
+        self._async_agent: Optional[Runnable] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_sessions = 0
 
-    def _create_agent(self) -> Runnable:
+    @asynccontextmanager
+    async def async_session(self) -> AsyncIterator["SearchAgent"]:
         """
-        Cria o agente LangChain com as ferramentas usando create_agent.
+        Abre, no event loop em execução, o cliente HTTP das pesquisas assíncronas.
 
-        Returns:
-            Runnable configurado
+        As conexões de um httpx.AsyncClient pertencem ao event loop que as abriu,
+        por isso o cliente é criado e fechado dentro do loop, e não compartilhado
+        entre execuções de `asyncio.run`. Sessões simultâneas compartilham o mesmo
+        cliente, fechado quando a última termina; pesquisas feitas dentro da
+        sessão reaproveitam as mesmas conexões:
+
+            async with agent.async_session():
+                await agent.search_software_licensing_batch_async(softwares)
+
+        Yields:
+            O próprio agente
         """
-        tools = [self.search_tool]
+        if self._async_sessions == 0:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout, limits=_HTTP_LIMITS)
+            llm = _create_llm(
+                self.base_url,
+                self.api_key,
+                self.model,
+                self.timeout,
+                http_async_client=self._async_client,
+            )
+            self._async_agent = _create_agent(llm)
+        self._async_sessions += 1
 
-        return create_agent(model=self.llm, tools=tools)
+        try:
+            yield self
+        finally:
+            self._async_sessions -= 1
+            if self._async_sessions == 0:
+                client = self._async_client
+                self._async_agent = self._async_client = None
+                await client.aclose()
 
     def search_software_licensing(
         self, software: Software, max_retries: Optional[int] = None
@@ -86,58 +245,278 @@ class SearchAgent:
         Returns:
             SoftwareResult com os resultados da pesquisa
         """
-        max_retries = max_retries or self.max_retries
+        return self.search_software_licensing_batch([software], max_retries=max_retries)[0]
 
-        logger.info(f"Pesquisando licenciamento para: {software.nome} {software.versao or ''}")
+    def search_software_licensing_batch(
+        self,
+        softwares: list[Software],
+        batch_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ) -> list[SoftwareResult]:
+        """
+        Pesquisa o licenciamento de vários softwares agrupando-os por requisição.
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Prepara o prompt
-                prompt_messages = self.prompt.invoke(
-                    {
-                        "nome": software.nome,
-                        "versao": software.versao or "N/A",
-                        "agent_scratchpad": [],
-                    }
-                ).to_messages()
+        Cada lote de até `batch_size` softwares é enviado ao agente em um único
+        prompt, amortizando o custo do prompt de sistema e das idas ao gateway.
+        Softwares já presentes no cache não são enviados ao agente.
 
-                # Executa o agente
-                logger.debug(f"Executando agente (tentativa {attempt}/{max_retries})...")
-                response = self.agent.invoke({"messages": prompt_messages})
+        Args:
+            softwares: Lista de softwares a serem pesquisados
+            batch_size: Softwares por requisição (usa settings se não fornecido)
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            Lista de SoftwareResult na mesma ordem de `softwares`
+        """
+        batch_size = batch_size or settings.batch_size
+
+        results, pending = self._lookup_cache(softwares)
+        for batch in batched(pending, batch_size):
+            batch_results = self._search_batch([softwares[idx] for idx in batch], max_retries)
+            self._store_results(softwares, batch, batch_results, results)
+
+        return results
 
-                # Extrai a resposta do último AIMessage
-                output = self._extract_output_content(response)
+    async def search_software_licensing_async(
+        self, software: Software, max_retries: Optional[int] = None
+    ) -> SoftwareResult:
+        """
+        Versão assíncrona de `search_software_licensing`.
 
-                # Tenta parsear JSON da resposta
-                result = self._parse_response(output, software)
+        Args:
+            software: Objeto Software a ser pesquisado
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
 
-                logger.info(
-                    f"Pesquisa concluída: {software.nome} - "
-                    f"Status: {result.status_verificado}, "
-                    f"Confiança: {result.nivel_confianca}%"
+        Returns:
+            SoftwareResult com os resultados da pesquisa
+        """
+        results = await self.search_software_licensing_batch_async([software], max_retries=max_retries)
+        return results[0]
+
+    async def search_software_licensing_batch_async(
+        self,
+        softwares: list[Software],
+        batch_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ) -> list[SoftwareResult]:
+        """
+        Versão assíncrona de `search_software_licensing_batch`.
+
+        Usa `ainvoke` do agente, de modo que várias pesquisas possam aguardar o
+        gateway ao mesmo tempo em um único event loop.
+
+        Args:
+            softwares: Lista de softwares a serem pesquisados
+            batch_size: Softwares por requisição (usa settings se não fornecido)
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            Lista de SoftwareResult na mesma ordem de `softwares`
+        """
+        batch_size = batch_size or settings.batch_size
+
+        results, pending = self._lookup_cache(softwares)
+        if not pending:
+            return results
+
+        # Usa a sessão aberta por quem chamou ou abre uma só para esta chamada
+        async with self.async_session():
+            for batch in batched(pending, batch_size):
+                batch_results = await self._search_batch_async(
+                    [softwares[idx] for idx in batch], max_retries
                 )
+                self._store_results(softwares, batch, batch_results, results)
+
+        return results
 
-                return result
+    def _lookup_cache(
+        self, softwares: list[Software]
+    ) -> tuple[list[Optional[SoftwareResult]], list[int]]:
+        """
+        Separa os softwares já presentes no cache dos que precisam ser pesquisados.
+
+        Args:
+            softwares: Lista de softwares a serem pesquisados
+
+        Returns:
+            Tupla com a lista de resultados (preenchida nos acertos do cache) e os
+            índices dos softwares pendentes
+        """
+        results: list[Optional[SoftwareResult]] = [None] * len(softwares)
+        pending: list[int] = []
+        for idx, software in enumerate(softwares):
+            cached = self.cache.get(software) if self.cache else None
+            if cached is not None:
+                logger.info(f"Resultado obtido do cache: {software.nome} {software.versao or ''}")
+                results[idx] = cached
+            else:
+                pending.append(idx)
+
+        return results, pending
+
+    def _store_results(
+        self,
+        softwares: list[Software],
+        batch: tuple[int, ...],
+        batch_results: list[SoftwareResult],
+        results: list[Optional[SoftwareResult]],
+    ) -> None:
+        """
+        Registra os resultados de um lote na lista final e no cache.
+
+        Args:
+            softwares: Lista completa de softwares
+            batch: Índices (em `softwares`) dos softwares do lote
+            batch_results: Resultados do lote, na ordem de `batch`
+            results: Lista final de resultados, atualizada no lugar
+        """
+        for idx, result in zip(batch, batch_results):
+            # Erros não são armazenados para que sejam pesquisados novamente
+            if self.cache and result.status_verificado != "Erro":
+                self.cache.set(softwares[idx], result)
+            results[idx] = result
+
+    def _search_batch(
+        self, softwares: list[Software], max_retries: Optional[int] = None
+    ) -> list[SoftwareResult]:
+        """
+        Executa o agente uma única vez para um lote de softwares.
 
-            except json.JSONDecodeError as e:
-                logger.warning(f"Erro ao parsear JSON (tentativa {attempt}/{max_retries}): {e}")
+        Args:
+            softwares: Softwares a serem pesquisados na mesma requisição
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            Lista de SoftwareResult na mesma ordem de `softwares`
+        """
+        max_retries = max_retries or self.max_retries
+        self._log_batch_start(softwares)
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                # Executa o agente
+                logger.debug(f"Executando agente (tentativa {attempt}/{max_retries})...")
+                self.rate_limiter.acquire()
+                response = self.agent.invoke(
+                    {"messages": build_search_messages(softwares)},
+                    config=self._agent_config(softwares),
+                )
+
+                return self._handle_response(response, softwares)
+
+            except Exception as e:
+                logger.warning(f"Erro na pesquisa (tentativa {attempt}/{max_retries}): {e}")
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
+                    time.sleep(self._backoff_time(attempt))
                 else:
-                    # Retorna resultado com erro
-                    return self._create_error_result(software, f"Erro ao parsear resposta: {e}")
+                    return self._create_error_results(softwares, f"Erro na pesquisa: {e}")
+
+        # Se chegou aqui, todas as tentativas falharam
+        return self._create_error_results(softwares, "Falha após todas as tentativas")
+
+    async def _search_batch_async(
+        self, softwares: list[Software], max_retries: Optional[int] = None
+    ) -> list[SoftwareResult]:
+        """
+        Versão assíncrona de `_search_batch`.
+
+        Args:
+            softwares: Softwares a serem pesquisados na mesma requisição
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            Lista de SoftwareResult na mesma ordem de `softwares`
+        """
+        max_retries = max_retries or self.max_retries
+        self._log_batch_start(softwares)
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                # Executa o agente
+                logger.debug(f"Executando agente (tentativa {attempt}/{max_retries})...")
+                await self.rate_limiter.acquire_async()
+                response = await self._async_agent.ainvoke(
+                    {"messages": build_search_messages(softwares)},
+                    config=self._agent_config(softwares),
+                )
+
+                return self._handle_response(response, softwares)
 
             except Exception as e:
                 logger.warning(f"Erro na pesquisa (tentativa {attempt}/{max_retries}): {e}")
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
+                    await asyncio.sleep(self._backoff_time(attempt))
                 else:
-                    return self._create_error_result(software, f"Erro na pesquisa: {e}")
+                    return self._create_error_results(softwares, f"Erro na pesquisa: {e}")
 
         # Se chegou aqui, todas as tentativas falharam
-        return self._create_error_result(software, "Falha após todas as tentativas")
+        return self._create_error_results(softwares, "Falha após todas as tentativas")
+
+    @staticmethod
+    def _agent_config(softwares: list[Software]) -> dict[str, Any]:
+        """
+        Monta a configuração de execução do agente para um lote.
+
+        Args:
+            softwares: Softwares a serem pesquisados na mesma requisição
+
+        Returns:
+            Configuração com o limite de passos proporcional ao lote
+        """
+        return {"recursion_limit": _RECURSION_BASE + _RECURSION_STEPS_PER_SOFTWARE * len(softwares)}
+
+    def _log_batch_start(self, softwares: list[Software]) -> None:
+        """
+        Registra no log o início da pesquisa de um lote.
+
+        Args:
+            softwares: Softwares a serem pesquisados na mesma requisição
+        """
+        nomes = ", ".join(f"{software.nome} {software.versao or ''}".strip() for software in softwares)
+        logger.info(f"Pesquisando licenciamento para: {nomes}")
+
+    def _handle_response(
+        self, response: dict[str, Any], softwares: list[Software]
+    ) -> list[SoftwareResult]:
+        """
+        Converte a resposta do agente nos resultados do lote.
+
+        Args:
+            response: Estado retornado pelo agente
+            softwares: Softwares enviados no prompt
+
+        Returns:
+            Lista de SoftwareResult na mesma ordem de `softwares`
+        """
+        # Extrai a resposta do último AIMessage
+        output = self._extract_output_content(response)
+
+        # Parseia o JSON localmente; se falhar, usa a extração manual sem nova chamada ao LLM
+        results = self._parse_response(output, softwares)
+
+        for result in results:
+            logger.info(
+                f"Pesquisa concluída: {result.nome} - "
+                f"Status: {result.status_verificado}, "
+                f"Confiança: {result.nivel_confianca}%"
+            )
+
+        return results
+
+    @staticmethod
+    def _backoff_time(attempt: int) -> float:
+        """
+        Calcula a espera antes da próxima tentativa.
+
+        Backoff limitado com jitter para não sincronizar as pesquisas após um 429.
+
+        Args:
+            attempt: Número da tentativa que falhou (a partir de 1)
+
+        Returns:
+            Tempo de espera em segundos
+        """
+        return min(2 ** attempt, _MAX_BACKOFF) + random.uniform(0, 1.0)
 
     def _extract_output_content(self, agent_response: dict[str, Any]) -> str:
         """
@@ -170,52 +549,94 @@ class SearchAgent:
 
         return str(agent_response.get("output", ""))
 
-    def _parse_response(self, output: str, software: Software) -> SoftwareResult:
+    def _parse_response(self, output: str, softwares: list[Software]) -> list[SoftwareResult]:
         """
-        Parseia a resposta do agente e cria um SoftwareResult.
+        Parseia a resposta do agente e cria um SoftwareResult por software.
 
         Args:
             output: Resposta do agente
-            software: Software original
+            softwares: Softwares enviados no prompt, na ordem da lista numerada
 
         Returns:
-            SoftwareResult parseado
+            Lista de SoftwareResult na mesma ordem de `softwares`
         """
-        # Tenta extrair JSON da resposta
-        json_str = self._extract_json_from_text(output)
-
+        # O formato antigo, com um único objeto por resposta, só vale para um único software
+        keys = ("results", "status_licenciamento") if len(softwares) == 1 else ("results",)
         try:
-            data = json.loads(json_str)
+            data = self._decode_json_object(output, keys)
         except json.JSONDecodeError:
             # Se não conseguir parsear, tenta extrair informações manualmente
-            logger.warning("Não foi possível parsear JSON, tentando extração manual...")
-            return self._extract_manual_result(output, software)
+            logger.warning("Resposta sem o JSON esperado, tentando extração manual...")
+            if len(softwares) == 1:
+                return [self._extract_manual_result(output, softwares[0])]
+            return self._create_error_results(softwares, "Resposta do agente sem o JSON de resultados")
+
+        items = data["results"] if "results" in data else [data]
+        if not isinstance(items, list):
+            items = [items]
+
+        # Mapeia cada item de volta ao software pelo número na lista
+        by_index: dict[int, dict[str, Any]] = {}
+        for position, item in enumerate(items, 1):
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("index", position))
+            except (TypeError, ValueError):
+                index = position
+            by_index.setdefault(index, item)
+
+        results = []
+        for index, software in enumerate(softwares, 1):
+            item = by_index.get(index)
+            if item is None:
+                results.append(
+                    self._create_error_result(software, "Software ausente na resposta do agente")
+                )
+                continue
+            # Um item inválido afeta só o próprio software, não o lote inteiro
+            try:
+                results.append(self._build_result(item, software, output))
+            except (ValueError, TypeError) as e:
+                results.append(self._create_error_result(software, f"Item inválido na resposta: {e}"))
 
-        # Valida e cria o resultado
-        status = str(data.get("status_licenciamento", "Não")).strip()
-        if status.lower() not in ["sim", "não", "nao", "yes", "no"]:
-            status = "Não"  # Default seguro
+        return results
+
+    def _build_result(self, data: dict[str, Any], software: Software, output: str) -> SoftwareResult:
+        """
+        Valida um item da resposta do agente e cria o SoftwareResult correspondente.
 
-        # Normaliza para "Sim" ou "Não"
-        if status.lower() in ["sim", "yes", "s"]:
-            status = "Sim"
-        else:
-            status = "Não"
+        Args:
+            data: Item da resposta JSON referente ao software
+            software: Software original
+            output: Resposta completa do agente (usada como resumo de reserva)
+
+        Returns:
+            SoftwareResult validado
+
+        Raises:
+            ValueError: Se a confiança não for numérica
+            TypeError: Se algum campo tiver tipo incompatível
+        """
+        # Normaliza para "Sim" ou "Não" ("Não" é o default seguro para valores desconhecidos)
+        status = str(data.get("status_licenciamento", "Não")).strip().lower()
+        status = "Sim" if status in _STATUS_YES else "Não"
 
         confianca = int(data.get("nivel_confianca", 50))
         confianca = max(0, min(100, confianca))  # Garante entre 0-100
 
-        fontes = data.get("fontes", [])
+        # Campos nulos (comuns na resposta do LLM) contam como ausentes
+        fontes = data.get("fontes") or []
         if isinstance(fontes, str):
             fontes = [f.strip() for f in fontes.split(";") if f.strip()]
 
-        links = data.get("links", [])
+        links = data.get("links") or []
         if isinstance(links, str):
             links = [l.strip() for l in links.split(";") if l.strip()]
 
-        resumo = data.get("resumo", output[:500])  # Limita resumo
+        resumo = data.get("resumo") or output[:500]  # Limita resumo
 
-        return SoftwareResult.from_software(
+        return SoftwareResult.from_raw(
             software,
             status_verificado=status,
             nivel_confianca=confianca,
@@ -224,25 +645,34 @@ class SearchAgent:
             resumo_pesquisa=resumo,
         )
 
-    def _extract_json_from_text(self, text: str) -> str:
+    def _decode_json_object(self, text: str, keys: tuple[str, ...]) -> dict[str, Any]:
         """
-        Extrai JSON de um texto que pode conter outros caracteres.
+        Decodifica o primeiro objeto JSON de um texto que contenha uma das chaves esperadas.
+
+        Usa `raw_decode` a partir de cada "{" encontrado, de modo que comentários,
+        chaves ou outros objetos JSON antes e depois da resposta não a invalidam.
 
         Args:
             text: Texto que pode conter JSON
+            keys: Chaves que identificam o objeto da resposta
 
         Returns:
-            String JSON extraída
+            Objeto JSON decodificado
+
+        Raises:
+            json.JSONDecodeError: Se nenhum objeto JSON com as chaves esperadas for encontrado
         """
-        # Tenta encontrar JSON entre chaves
         start = text.find("{")
-        end = text.rfind("}")
-
-        if start != -1 and end != -1 and end > start:
-            return text[start : end + 1]
+        while start != -1:
+            try:
+                data, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                data = None
+            if isinstance(data, dict) and any(key in data for key in keys):
+                return data
+            start = text.find("{", start + 1)
 
-        # Se não encontrar, retorna o texto original
-        return text
+        raise json.JSONDecodeError("Nenhum objeto JSON encontrado", text, 0)
 
     def _extract_manual_result(self, output: str, software: Software) -> SoftwareResult:
         """
@@ -255,31 +685,37 @@ class SearchAgent:
         Returns:
             SoftwareResult com informações extraídas manualmente
         """
-        # Tenta identificar status
-        output_lower = output.lower()
-        if "sim" in output_lower or "yes" in output_lower or "requer" in output_lower:
-            status = "Sim"
-        else:
-            status = "Não"
+        # Tenta identificar status (uma única varredura, sem copiar o texto em minúsculas)
+        status = "Sim" if _STATUS_SIM_RE.search(output) else "Não"
 
         # Confiança baixa para resultados manuais
         confianca = 40
 
-        # Tenta extrair links
-        import re
+        # Tenta extrair links, parando a varredura no limite de links
+        links = [match.group() for match in islice(_URL_RE.finditer(output), _MAX_MANUAL_LINKS)]
 
-        url_pattern = r"https?://[^\s]+"
-        links = re.findall(url_pattern, output)
-
-        return SoftwareResult.from_software(
+        return SoftwareResult.from_raw(
             software,
             status_verificado=status,
             nivel_confianca=confianca,
             fontes_utilizadas=["Resposta do agente"],
-            links_fontes=links[:5],  # Limita a 5 links
+            links_fontes=links,
             resumo_pesquisa=output[:500],
         )
 
+    def _create_error_results(self, softwares: list[Software], error_msg: str) -> list[SoftwareResult]:
+        """
+        Cria um resultado de erro para cada software de um lote.
+
+        Args:
+            softwares: Softwares do lote
+            error_msg: Mensagem de erro
+
+        Returns:
+            Lista de SoftwareResult com status de erro
+        """
+        return [self._create_error_result(software, error_msg) for software in softwares]
+
     def _create_error_result(self, software: Software, error_msg: str) -> SoftwareResult:
         """
         Cria um resultado de erro.
@@ -1,6 +1,8 @@
 """Configurações do sistema usando Pydantic Settings."""
 
 from pathlib import Path
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,6 +24,9 @@ class Settings(BaseSettings):
     sharepoint_file: str = Field(..., description="Nome do arquivo Excel")
     sharepoint_username: str = Field(..., description="Usuário do SharePoint")
     sharepoint_password: str = Field(..., description="Senha do SharePoint")
+    sharepoint_auth_cache_minutes: int = Field(
+        default=60, ge=0, description="Validade do cache de cookies de autenticação em minutos (0 desativa)"
+    )
 
     # LLM Gateway
     llm_base_url: str = Field(..., description="URL base do gateway LLM")
@@ -31,16 +36,24 @@ class Settings(BaseSettings):
     # Arquivos
     output_file: str = Field(default="resultados_licenciamento.xlsx", description="Nome do arquivo de saída")
     output_dir: Path = Field(default=Path("./output"), description="Diretório de saída")
+    excel_engine: Literal["openpyxl", "xlsxwriter", "xml"] = Field(
+        default="openpyxl", description="Forma de gravação do Excel de saída"
+    )
+
+    # Cache de pesquisas
+    cache_enabled: bool = Field(default=True, description="Reaproveita resultados de pesquisas anteriores")
+    cache_dir: Path = Field(default=Path("./cache"), description="Diretório do cache de pesquisas")
+    cache_ttl_days: int = Field(default=7, ge=0, description="Validade das entradas do cache em dias")
+    known_catalog_enabled: bool = Field(default=True, description="Resolve softwares conhecidos pelo catálogo local, sem pesquisa")
 
     # Configurações
     max_retries: int = Field(default=3, description="Número máximo de tentativas")
     request_timeout: int = Field(default=30, description="Timeout de requisições em segundos")
     confidence_threshold: int = Field(default=70, description="Limiar mínimo de confiança (0-100)")
-
-    def __init__(self, **kwargs):
-        """Inicializa as configurações e cria o diretório de saída se necessário."""
-        super().__init__(**kwargs)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    concurrency: int = Field(default=4, ge=1, description="Número de pesquisas executadas em paralelo")
+    batch_size: int = Field(default=10, ge=1, description="Número de softwares pesquisados por requisição ao LLM")
+    requests_per_second: float = Field(default=2.0, gt=0, description="Taxa máxima de requisições ao LLM por segundo")
+    burst: int = Field(default=4, ge=1, description="Número de requisições permitidas em rajada")
 
     @property
     def output_path(self) -> Path:
@@ -4,12 +4,15 @@ import logging
 from pathlib import Path
 from typing import List
 
-import pandas as pd
+from openpyxl import load_workbook
 
 from src.models.software import Software
 
 logger = logging.getLogger(__name__)
 
+# Valores da coluna A que indicam uma linha de cabeçalho
+_HEADER_TOKENS = frozenset({"nome", "software"})
+
 
 class ExcelReader:
     """Classe para ler arquivos Excel e extrair dados de softwares."""
@@ -44,52 +47,43 @@ class ExcelReader:
 
         try:
             logger.info(f"Lendo arquivo Excel: {self.file_path}")
-            # Lê o Excel, assumindo que a primeira linha pode ser cabeçalho
-            df = pd.read_excel(self.file_path, header=None)
+            # Modo somente leitura: as linhas são lidas sob demanda, sem carregar a planilha inteira
+            wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error(f"Erro ao ler arquivo Excel: {e}")
+            raise ValueError(f"Erro ao processar arquivo Excel: {e}") from e
 
-            # Valida se tem pelo menos uma coluna
-            if df.empty:
-                logger.warning("Arquivo Excel está vazio")
-                return []
+        try:
+            # Sempre a primeira aba, não a que estava selecionada ao salvar
+            ws = wb.worksheets[0]
+            # A dimensão gravada no arquivo pode estar errada (ex: "A1"), o que faria o
+            # modo somente leitura parar antes das últimas linhas
+            ws.reset_dimensions()
+            softwares = []
+            ignoradas = 0
+
+            # Pega as primeiras 3 colunas (A, B, C); a primeira linha pode ser cabeçalho.
+            # Linhas mais curtas são completadas com None pelo iter_rows via max_col.
+            for nome, versao, status in ws.iter_rows(min_row=1, max_col=3, values_only=True):
+                # Extrai dados das colunas (A, B, C); valores vazios viram "" e são descartados
+                nome = str(nome).strip() if nome is not None else ""
+                versao = str(versao).strip() if versao is not None else ""
+                status = str(status).strip() if status is not None else ""
+
+                # Ignora linhas vazias, sem nome ou de cabeçalho
+                if not nome or nome.lower() in _HEADER_TOKENS:
+                    ignoradas += 1
+                    continue
 
-            # Pega as primeiras 3 colunas (A, B, C)
-            # Remove linhas completamente vazias
-            df = df.iloc[:, :3].dropna(how="all")
+                softwares.append(
+                    Software(nome=nome, versao=versao or None, status_original=status or None)
+                )
 
-            # Verifica se há dados
-            if len(df) == 0:
-                logger.warning("Nenhum dado encontrado no arquivo Excel")
-                return []
+            if ignoradas:
+                logger.debug(f"Linhas ignoradas (vazias, sem nome ou cabeçalho): {ignoradas}")
 
-            softwares = []
-            for idx, row in df.iterrows():
-                try:
-                    # Extrai dados das colunas (índices 0, 1, 2)
-                    nome = str(row.iloc[0]).strip() if pd.notna(row.iloc[0]) else ""
-                    versao = str(row.iloc[1]).strip() if pd.notna(row.iloc[1]) else None
-                    status = str(row.iloc[2]).strip() if pd.notna(row.iloc[2]) else None
-
-                    # Ignora linhas vazias ou sem nome
-                    if not nome or nome.lower() in ["nome", "software", ""]:
-                        continue
-
-                    # Normaliza valores None
-                    if versao == "" or versao == "nan":
-                        versao = None
-                    if status == "" or status == "nan":
-                        status = None
-
-                    software = Software(
-                        nome=nome,
-                        versao=versao if versao else None,
-                        status_original=status if status else None,
-                    )
-                    softwares.append(software)
-                    logger.debug(f"Software lido: {software.nome} - {software.versao}")
-
-                except Exception as e:
-                    logger.warning(f"Erro ao processar linha {idx + 1}: {e}")
-                    continue
+            if not softwares:
+                logger.warning("Nenhum dado encontrado no arquivo Excel")
 
             logger.info(f"Total de softwares lidos: {len(softwares)}")
             return softwares
@@ -98,3 +92,5 @@ class ExcelReader:
             logger.error(f"Erro ao ler arquivo Excel: {e}")
             raise ValueError(f"Erro ao processar arquivo Excel: {e}") from e
 
+        finally:
+            wb.close()
@@ -1,170 +1,353 @@
 """Escritor de arquivos Excel com formatação."""
 
 import logging
+from copy import copy
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import Iterable, Sequence
 
-import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.styles.fonts import DEFAULT_FONT
 
+from src.excel.xlsx_xml import XmlSheet
 from src.models.software import SoftwareResult
 
 logger = logging.getLogger(__name__)
 
 
-class ExcelWriter:
-    """Classe para escrever resultados em arquivos Excel com formatação."""
+# Cabeçalho do arquivo de saída, na ordem de SoftwareResult.to_excel_tuple
+HEADERS = (
+    "Nome",
+    "Versão",
+    "Status Original",
+    "Status Verificado",
+    "Data Pesquisa",
+    "Fontes",
+    "Links",
+    "Confiança",
+    "Resumo",
+)
+
+# Largura de cada coluna, na ordem de HEADERS
+COLUMN_WIDTHS = {
+    "A": 30,  # Nome
+    "B": 15,  # Versão
+    "C": 18,  # Status Original
+    "D": 18,  # Status Verificado
+    "E": 20,  # Data Pesquisa
+    "F": 25,  # Fontes
+    "G": 40,  # Links
+    "H": 12,  # Confiança
+    "I": 50,  # Resumo
+}
+
+# Estilo base de cada coluna, por posição: status e confiança centralizados,
+# data com formato de data e hora, as demais alinhadas à esquerda
+_BASE_STYLES = {
+    "Status Original": "body_center",
+    "Status Verificado": "body_center",
+    "Data Pesquisa": "body_date",
+    "Confiança": "body_center",
+}
+COLUMN_STYLES = tuple(_BASE_STYLES.get(column, "body_left") for column in HEADERS)
+
+# Posição das colunas com formatação condicional
+_STATUS_COL = HEADERS.index("Status Verificado")
+_CONFIANCA_COL = HEADERS.index("Confiança")
+
+# Estilo da coluna de status verificado, pelo valor do status
+# (já normalizado para a grafia canônica pelo SoftwareResult)
+STATUS_STYLES = {
+    "Sim": "status_sim",
+    "Não": "status_nao",
+    "Erro": "status_erro",
+}
+
+# Estilo da coluna de confiança, indexado por (confiança >= 50) + (confiança >= 80)
+CONFIANCA_STYLES = ("conf_low", "conf_med", "conf_high")
+
+# Objetos de estilo reaproveitados por todas as células
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+GREEN_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+YELLOW_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+RED_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+LEFT_ALIGNMENT = Alignment(horizontal="left", vertical="top", wrap_text=True)
+
+# Formato de exibição da data da pesquisa, gravada como data nativa do Excel
+DATE_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+# Os mesmos estilos, no formato de propriedades do xlsxwriter
+_XLSX_CENTER = {"align": "center", "valign": "vcenter"}
+_XLSX_LEFT = {"align": "left", "valign": "top", "text_wrap": True}
+XLSXWRITER_FORMATS = {
+    "header": {"bold": True, "font_color": "#FFFFFF", "font_size": 11, "bg_color": "#366092", **_XLSX_CENTER},
+    "body_left": _XLSX_LEFT,
+    "body_center": _XLSX_CENTER,
+    "body_date": {"num_format": DATE_FORMAT, **_XLSX_LEFT},
+    "conf_high": {"bg_color": "#C6EFCE", **_XLSX_CENTER},
+    "conf_med": {"bg_color": "#FFEB9C", **_XLSX_CENTER},
+    "conf_low": {"bg_color": "#FFC7CE", **_XLSX_CENTER},
+    "status_sim": {"bg_color": "#FFC7CE", "bold": True, "font_color": "#9C0006", **_XLSX_CENTER},
+    "status_nao": {"bg_color": "#C6EFCE", "bold": True, "font_color": "#006100", **_XLSX_CENTER},
+    "status_erro": {"bg_color": "#FFC7CE", "bold": True, "font_color": "#000000", **_XLSX_CENTER},
+}
+
+
+def _build_named_styles() -> list[NamedStyle]:
+    """
+    Cria os estilos nomeados usados na planilha de saída.
+
+    Um NamedStyle fica vinculado ao workbook em que é registrado, por isso
+    cada ExcelWriter cria os seus a partir dos objetos de estilo do módulo.
+
+    Returns:
+        Lista de NamedStyle a registrar no workbook
+    """
+    return [
+        NamedStyle(name="header", fill=HEADER_FILL, font=HEADER_FONT, alignment=CENTER_ALIGNMENT),
+        NamedStyle(name="body_left", font=DEFAULT_FONT, alignment=LEFT_ALIGNMENT),
+        NamedStyle(name="body_center", font=DEFAULT_FONT, alignment=CENTER_ALIGNMENT),
+        NamedStyle(
+            name="body_date",
+            font=DEFAULT_FONT,
+            alignment=LEFT_ALIGNMENT,
+            number_format=DATE_FORMAT,
+        ),
+        # Confiança: alta (>= 80), média (>= 50) e baixa
+        NamedStyle(name="conf_high", fill=GREEN_FILL, font=DEFAULT_FONT, alignment=CENTER_ALIGNMENT),
+        NamedStyle(name="conf_med", fill=YELLOW_FILL, font=DEFAULT_FONT, alignment=CENTER_ALIGNMENT),
+        NamedStyle(name="conf_low", fill=RED_FILL, font=DEFAULT_FONT, alignment=CENTER_ALIGNMENT),
+        # Status verificado
+        NamedStyle(
+            name="status_sim",
+            fill=RED_FILL,
+            font=Font(bold=True, color="9C0006"),
+            alignment=CENTER_ALIGNMENT,
+        ),
+        NamedStyle(
+            name="status_nao",
+            fill=GREEN_FILL,
+            font=Font(bold=True, color="006100"),
+            alignment=CENTER_ALIGNMENT,
+        ),
+        NamedStyle(
+            name="status_erro",
+            fill=RED_FILL,
+            font=Font(bold=True, color="000000"),
+            alignment=CENTER_ALIGNMENT,
+        ),
+    ]
+
+
+class _OpenpyxlSheet:
+    """Planilha de saída gravada pelo openpyxl em modo somente escrita."""
 
     def __init__(self, output_path: Path):
+        """
+        Cria o workbook, registra os estilos e configura a planilha.
+
+        Args:
+            output_path: Caminho do arquivo de saída
+        """
+        self.output_path = output_path
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet(title="Sheet1")
+        # Guarda o StyleArray de cada estilo registrado: atribuir cell.style pelo nome
+        # procura o estilo na lista do workbook a cada célula
+        self._style_arrays = {}
+        for style in _build_named_styles():
+            self._wb.add_named_style(style)
+            self._style_arrays[style.name] = style.as_tuple()
+
+        # Em modo somente escrita, larguras e painéis congelados precisam
+        # ser definidos antes da primeira linha
+        for col, width in COLUMN_WIDTHS.items():
+            self._ws.column_dimensions[col].width = width
+        self._ws.freeze_panes = "A2"
+
+    def write_row(self, values: Sequence, styles: Sequence[str]) -> None:
+        """
+        Grava uma linha com o estilo nomeado de cada célula.
+
+        Args:
+            values: Valores da linha, na ordem de HEADERS
+            styles: Nome do estilo de cada célula
+        """
+        cells = []
+        for value, style in zip(values, styles):
+            # Textos que não passaram por SoftwareResult.from_raw (mensagens de erro,
+            # entradas antigas do cache) podem trazer caracteres de controle, que o
+            # openpyxl recusa; são removidos como no engine "xml"
+            if isinstance(value, str):
+                value = ILLEGAL_CHARACTERS_RE.sub("", value)
+            cell = WriteOnlyCell(self._ws, value=value)
+            cell._style = copy(self._style_arrays[style])
+            cells.append(cell)
+        self._ws.append(cells)
+
+    def close(self) -> None:
+        """Salva o arquivo de saída."""
+        self._wb.save(self.output_path)
+
+
+class _XlsxWriterSheet:
+    """Planilha de saída gravada pelo xlsxwriter em modo de memória constante."""
+
+    def __init__(self, output_path: Path):
+        """
+        Cria o workbook, os formatos e configura a planilha.
+
+        Args:
+            output_path: Caminho do arquivo de saída
+        """
+        try:
+            import xlsxwriter
+        except ImportError as e:
+            raise ImportError(
+                "O engine 'xlsxwriter' requer o pacote xlsxwriter. "
+                "Instale com: pip install -e '.[xlsxwriter]'"
+            ) from e
+
+        # Em constant_memory cada linha é descarregada em disco ao iniciar a próxima,
+        # o que exige gravar as linhas em ordem (como o ExcelWriter já faz).
+        # Textos são gravados sempre como texto: sem isso, valores iniciados por "="
+        # viram fórmulas e os links unidos viram um único hyperlink inválido
+        options = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+        self._wb = xlsxwriter.Workbook(str(output_path), options)
+        self._ws = self._wb.add_worksheet("Sheet1")
+        self._formats = {name: self._wb.add_format(props) for name, props in XLSXWRITER_FORMATS.items()}
+        self._row = 0
+
+        for col, width in COLUMN_WIDTHS.items():
+            self._ws.set_column(f"{col}:{col}", width)
+        self._ws.freeze_panes(1, 0)
+
+    def write_row(self, values: Sequence, styles: Sequence[str]) -> None:
+        """
+        Grava uma linha com o formato de cada célula.
+
+        Args:
+            values: Valores da linha, na ordem de HEADERS
+            styles: Nome do estilo de cada célula
+        """
+        for col, (value, style) in enumerate(zip(values, styles)):
+            self._ws.write(self._row, col, value, self._formats[style])
+        self._row += 1
+
+    def close(self) -> None:
+        """Finaliza e salva o arquivo de saída."""
+        self._wb.close()
+
+
+# Implementações de planilha disponíveis, por nome de engine
+_ENGINES = {
+    "openpyxl": _OpenpyxlSheet,
+    "xlsxwriter": _XlsxWriterSheet,
+    "xml": partial(XmlSheet, column_widths=tuple(COLUMN_WIDTHS.values())),
+}
+
+_HEADER_STYLES = ("header",) * len(HEADERS)
+
+
+class ExcelWriter:
+    """
+    Classe para escrever resultados em arquivos Excel com formatação.
+
+    Pode ser usada como gerenciador de contexto para gravar os resultados
+    incrementalmente com `append`, à medida que ficam prontos:
+
+        with ExcelWriter(path) as writer:
+            writer.append(result)
+    """
+
+    def __init__(self, output_path: Path, engine: str = "openpyxl"):
         """
         Inicializa o escritor de Excel.
 
         Args:
             output_path: Caminho do arquivo de saída
+            engine: Forma de gravação ("openpyxl", "xlsxwriter" ou "xml")
         """
+        if engine not in _ENGINES:
+            raise ValueError(f"Engine de Excel desconhecido: {engine}. Use um de: {', '.join(_ENGINES)}")
+
         self.output_path = output_path
+        self.engine = engine
+        self._sheet = None
+        self._count = 0
 
-    def write_results(self, results: List[SoftwareResult]) -> bool:
+    def __enter__(self) -> "ExcelWriter":
+        """Abre a planilha de saída e grava o cabeçalho."""
+        # Garante que o diretório existe
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._sheet = _ENGINES[self.engine](self.output_path)
+        self._sheet.write_row(HEADERS, _HEADER_STYLES)
+        self._count = 0
+        return self
+
+    def append(self, result: SoftwareResult) -> None:
+        """
+        Acrescenta um resultado como nova linha da planilha.
+
+        Args:
+            result: Resultado a ser gravado
+        """
+        if self._sheet is None:
+            raise RuntimeError("ExcelWriter não foi aberto. Use-o em um bloco 'with'.")
+
+        # Formatação condicional decidida a partir do resultado, antes de criar as células
+        styles = list(COLUMN_STYLES)
+        confianca = result.nivel_confianca
+        styles[_CONFIANCA_COL] = CONFIANCA_STYLES[(confianca >= 50) + (confianca >= 80)]
+        styles[_STATUS_COL] = STATUS_STYLES.get(result.status_verificado, "body_center")
+
+        self._sheet.write_row(result.to_excel_tuple(), styles)
+        self._count += 1
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Salva a planilha, mesmo parcial em caso de erro."""
+        sheet, self._sheet = self._sheet, None
+        if sheet is None:
+            return
+
+        if exc_type is not None:
+            logger.warning(f"Salvando resultados parciais ({self._count} linhas) em: {self.output_path}")
+
+        sheet.close()
+        logger.info(f"Arquivo Excel criado com sucesso: {self.output_path}")
+
+    def write_results(self, results: Iterable[SoftwareResult]) -> bool:
         """
         Escreve os resultados em um arquivo Excel com formatação.
 
+        Os resultados são consumidos um a um, então um gerador é gravado à medida
+        que produz cada item, sem materializar a lista completa.
+
         Args:
-            results: Lista de SoftwareResult
+            results: Iterável de SoftwareResult (lista, gerador etc.)
 
         Returns:
             True se escrita bem-sucedida, False caso contrário
         """
         try:
-            logger.info(f"Escrevendo {len(results)} resultados em: {self.output_path}")
-
-            # Garante que o diretório existe
-            self.output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Converte resultados para DataFrame
-            data = [result.to_excel_row() for result in results]
-            df = pd.DataFrame(data)
-
-            # Define a ordem das colunas
-            columns = [
-                "Nome",
-                "Versão",
-                "Status Original",
-                "Status Verificado",
-                "Data Pesquisa",
-                "Fontes",
-                "Links",
-                "Confiança",
-                "Resumo",
-            ]
-            df = df[columns]
-
-            # Salva o Excel
-            df.to_excel(self.output_path, index=False, engine="openpyxl")
-
-            # Aplica formatação
-            self._apply_formatting(self.output_path)
-
-            logger.info(f"Arquivo Excel criado com sucesso: {self.output_path}")
-            return True
+            logger.info(f"Escrevendo resultados em: {self.output_path}")
 
-        except Exception as e:
-            logger.error(f"Erro ao escrever arquivo Excel: {e}")
-            return False
+            with self:
+                for result in results:
+                    self.append(result)
 
-    def _apply_formatting(self, file_path: Path) -> None:
-        """
-        Aplica formatação ao arquivo Excel.
+                if self._count == 0:
+                    # Sem resultados, o arquivo de saída contém apenas o cabeçalho
+                    logger.warning(f"Nenhum resultado a escrever; gerando apenas o cabeçalho em: {self.output_path}")
 
-        Args:
-            file_path: Caminho do arquivo Excel
-        """
-        try:
-            wb = load_workbook(file_path)
-            ws = wb.active
-
-            # Formatação do cabeçalho
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            header_alignment = Alignment(horizontal="center", vertical="center")
-
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = header_alignment
-
-            # Ajusta largura das colunas
-            column_widths = {
-                "A": 30,  # Nome
-                "B": 15,  # Versão
-                "C": 18,  # Status Original
-                "D": 18,  # Status Verificado
-                "E": 20,  # Data Pesquisa
-                "F": 25,  # Fontes
-                "G": 40,  # Links
-                "H": 12,  # Confiança
-                "I": 50,  # Resumo
-            }
-
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
-
-            # Formatação condicional baseada em confiança e status
-            for row_idx, row in enumerate(ws.iter_rows(min_row=2, max_row=ws.max_row), start=2):
-                # Coluna de Confiança (H)
-                confianca_cell = ws[f"H{row_idx}"]
-                confianca_value = confianca_cell.value
-
-                if isinstance(confianca_value, (int, float)):
-                    if confianca_value >= 80:
-                        confianca_cell.fill = PatternFill(
-                            start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-                        )
-                    elif confianca_value >= 50:
-                        confianca_cell.fill = PatternFill(
-                            start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"
-                        )
-                    else:
-                        confianca_cell.fill = PatternFill(
-                            start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-                        )
-
-                # Coluna de Status Verificado (D)
-                status_cell = ws[f"D{row_idx}"]
-                status_value = str(status_cell.value or "").upper()
-
-                if status_value == "SIM":
-                    status_cell.fill = PatternFill(
-                        start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-                    )
-                    status_cell.font = Font(bold=True, color="9C0006")
-                elif status_value == "NÃO" or status_value == "NAO":
-                    status_cell.fill = PatternFill(
-                        start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"
-                    )
-                    status_cell.font = Font(bold=True, color="006100")
-                elif status_value == "ERRO":
-                    status_cell.fill = PatternFill(
-                        start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-                    )
-                    status_cell.font = Font(bold=True, color="000000")
-
-                # Alinhamento de células
-                for cell in row:
-                    if cell.column_letter in ["H"]:  # Confiança - centralizado
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                    elif cell.column_letter in ["D", "C"]:  # Status - centralizado
-                        cell.alignment = Alignment(horizontal="center", vertical="center")
-                    else:  # Outras colunas - alinhamento à esquerda
-                        cell.alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-
-            # Congela a primeira linha
-            ws.freeze_panes = "A2"
-
-            # Salva as alterações
-            wb.save(file_path)
-            logger.debug("Formatação aplicada com sucesso")
+            return True
 
         except Exception as e:
-            logger.warning(f"Erro ao aplicar formatação (arquivo ainda foi criado): {e}")
-
+            logger.error(f"Erro ao escrever arquivo Excel: {e}")
+            return False
@@ -0,0 +1,212 @@
+"""Gravação de XLSX escrevendo o XML da planilha diretamente, sem objetos de célula."""
+
+import re
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+from xml.sax.saxutils import escape
+
+# Partes fixas do pacote XLSX (uma única planilha "Sheet1")
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    "</Relationships>"
+)
+
+# Tabela de estilos pré-montada com os mesmos estilos nomeados do ExcelWriter.
+# Fontes: 0 padrão, 1 cabeçalho, 2-4 status (sim, não, erro)
+# Preenchimentos: 0-1 obrigatórios, 2 cabeçalho, 3 verde, 4 amarelo, 5 vermelho
+_CENTER = '<alignment horizontal="center" vertical="center"/>'
+_LEFT = '<alignment horizontal="left" vertical="top" wrapText="1"/>'
+
+
+def _solid_fill(rgb: str) -> str:
+    """Preenchimento sólido na cor ARGB informada."""
+    return f'<fill><patternFill patternType="solid"><fgColor rgb="{rgb}"/><bgColor rgb="{rgb}"/></patternFill></fill>'
+
+
+def _xf(font: int, fill: int, alignment: str, num_fmt: int = 0) -> str:
+    """Formato de célula (entrada de cellXfs)."""
+    return (
+        f'<xf numFmtId="{num_fmt}" fontId="{font}" fillId="{fill}" borderId="0" xfId="0" '
+        f'applyNumberFormat="{int(num_fmt != 0)}" applyFont="1" applyFill="1" applyAlignment="1">'
+        f"{alignment}</xf>"
+    )
+
+
+# Índice em cellXfs de cada estilo nomeado
+STYLE_IDS = {
+    "header": 1,
+    "body_left": 2,
+    "body_center": 3,
+    "body_date": 4,
+    "conf_high": 5,
+    "conf_med": 6,
+    "conf_low": 7,
+    "status_sim": 8,
+    "status_nao": 9,
+    "status_erro": 10,
+}
+
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+    '<fonts count="5">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FF9C0006"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FF006100"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FF000000"/><name val="Calibri"/><family val="2"/></font>'
+    "</fonts>"
+    '<fills count="6">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    f'{_solid_fill("FF366092")}{_solid_fill("FFC6EFCE")}{_solid_fill("FFFFEB9C")}{_solid_fill("FFFFC7CE")}'
+    "</fills>"
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="11">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    f"{_xf(1, 2, _CENTER)}"  # header
+    f"{_xf(0, 0, _LEFT)}"  # body_left
+    f"{_xf(0, 0, _CENTER)}"  # body_center
+    f"{_xf(0, 0, _LEFT, num_fmt=164)}"  # body_date
+    f"{_xf(0, 3, _CENTER)}"  # conf_high
+    f"{_xf(0, 4, _CENTER)}"  # conf_med
+    f"{_xf(0, 5, _CENTER)}"  # conf_low
+    f"{_xf(2, 5, _CENTER)}"  # status_sim
+    f"{_xf(3, 3, _CENTER)}"  # status_nao
+    f"{_xf(4, 5, _CENTER)}"  # status_erro
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+# Caracteres de controle que não são permitidos em XML
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Origem das datas seriais do Excel (sistema de datas 1900)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_COLUMN_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class XmlSheet:
+    """
+    Planilha de saída gravada como XML, linha a linha, direto no pacote XLSX.
+
+    As partes fixas do pacote são gravadas na abertura e o XML da planilha é
+    transmitido para dentro do zip à medida que as linhas chegam.
+    """
+
+    def __init__(self, output_path: Path, column_widths: Sequence[float]):
+        """
+        Cria o pacote XLSX e inicia o XML da planilha.
+
+        Args:
+            output_path: Caminho do arquivo de saída
+            column_widths: Largura de cada coluna, da coluna A em diante
+        """
+        self._zip = zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr("xl/workbook.xml", _WORKBOOK)
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w")
+        self._row = 0
+
+        cols = "".join(
+            f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+            for i, width in enumerate(column_widths, start=1)
+        )
+        self._write(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheetViews><sheetView workbookViewId="0">'
+            '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+            '<selection pane="bottomLeft"/>'
+            "</sheetView></sheetViews>"
+            f"<cols>{cols}</cols>"
+            "<sheetData>"
+        )
+
+    def _write(self, text: str) -> None:
+        """Grava um trecho do XML da planilha."""
+        self._sheet.write(text.encode("utf-8"))
+
+    def write_row(self, values: Sequence, styles: Sequence[str]) -> None:
+        """
+        Grava uma linha com o estilo nomeado de cada célula.
+
+        Args:
+            values: Valores da linha, na ordem de HEADERS
+            styles: Nome do estilo de cada célula
+        """
+        self._row += 1
+        r = self._row
+        parts = [f'<row r="{r}">']
+        for letter, value, style in zip(_COLUMN_LETTERS, values, styles):
+            sid = STYLE_IDS[style]
+            if value is None or value == "":
+                parts.append(f'<c r="{letter}{r}" s="{sid}"/>')
+            elif isinstance(value, datetime):
+                serial = (value - _EXCEL_EPOCH).total_seconds() / 86400
+                parts.append(f'<c r="{letter}{r}" s="{sid}"><v>{serial}</v></c>')
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                parts.append(f'<c r="{letter}{r}" s="{sid}"><v>{value}</v></c>')
+            else:
+                text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+                parts.append(
+                    f'<c r="{letter}{r}" s="{sid}" t="inlineStr">'
+                    f'<is><t xml:space="preserve">{text}</t></is></c>'
+                )
+        parts.append("</row>")
+        self._write("".join(parts))
+
+    def close(self) -> None:
+        """Finaliza o XML da planilha e fecha o pacote."""
+        self._write("</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
@@ -1,38 +1,82 @@
 """Modelos de dados para softwares e resultados de pesquisa."""
 
+import re
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Optional
 
+# Grafia canônica do status verificado, pela grafia em minúsculas
+_STATUS_CANONICAL = {"sim": "Sim", "não": "Não", "nao": "Não", "erro": "Erro"}
 
-class Software(BaseModel):
+# Caracteres de controle que não podem ser gravados em planilhas (XML)
+_ILLEGAL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _clean_text(value: Any) -> str:
+    """Converte um valor externo em texto, sem caracteres que o Excel não aceita."""
+    return _ILLEGAL_CHARS_RE.sub("", str(value))
+
+
+@dataclass(slots=True)
+class Software:
     """Modelo base para representar um software da planilha original."""
 
-    nome: str = Field(..., description="Nome do software")
-    versao: Optional[str] = Field(default=None, description="Versão do software")
-    status_original: Optional[str] = Field(default=None, description="Status original (Sim/Não)")
+    nome: str
+    versao: Optional[str] = None
+    status_original: Optional[str] = None
 
-    class Config:
-        """Configuração do modelo."""
+    @property
+    def dedup_key(self) -> tuple[str, str]:
+        """Chave normalizada (nome, versão) que identifica linhas repetidas do mesmo software."""
+        return self.nome.strip().lower(), (self.versao or "").strip()
 
-        frozen = False
 
+@dataclass(slots=True, kw_only=True)
+class SoftwareResult:
+    """
+    Modelo estendido com resultados da pesquisa de licenciamento.
 
-class SoftwareResult(BaseModel):
-    """Modelo estendido com resultados da pesquisa de licenciamento."""
+    Os resultados são criados internamente a partir de dados já tratados, sem
+    validação; a resposta do agente passa por `from_raw`. O cache reconstrói os
+    resultados com `from_software`, pois só armazena resultados já validados.
+    """
 
     # Dados originais
-    nome: str = Field(..., description="Nome do software")
-    versao: Optional[str] = Field(default=None, description="Versão do software")
-    status_original: Optional[str] = Field(default=None, description="Status original (Sim/Não)")
+    nome: str
+    versao: Optional[str] = None
+    status_original: Optional[str] = None
 
     # Resultados da pesquisa
-    status_verificado: str = Field(..., description="Status verificado: Sim ou Não")
-    data_pesquisa: datetime = Field(default_factory=datetime.now, description="Data e hora da pesquisa")
-    fontes_utilizadas: list[str] = Field(default_factory=list, description="Lista de fontes utilizadas")
-    links_fontes: list[str] = Field(default_factory=list, description="Lista de links das fontes")
-    nivel_confianca: int = Field(..., ge=0, le=100, description="Nível de confiança (0-100)")
-    resumo_pesquisa: Optional[str] = Field(default=None, description="Resumo da pesquisa realizada")
+    status_verificado: str  # Sim, Não ou Erro
+    data_pesquisa: datetime = field(default_factory=datetime.now)
+    fontes_utilizadas: list[str] = field(default_factory=list)
+    links_fontes: list[str] = field(default_factory=list)
+    nivel_confianca: int  # 0-100
+    resumo_pesquisa: Optional[str] = None
+
+    # Fontes e links unidos para o Excel, calculados na primeira leitura
+    # (slots não permite functools.cached_property)
+    _fontes_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _links_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normaliza o status verificado para a grafia canônica (Sim, Não ou Erro)."""
+        status = self.status_verificado
+        self.status_verificado = _STATUS_CANONICAL.get(status.strip().lower(), status)
+
+    @property
+    def fontes_str(self) -> str:
+        """Fontes utilizadas separadas por ponto-e-vírgula."""
+        if self._fontes_str is None:
+            self._fontes_str = "; ".join(self.fontes_utilizadas)
+        return self._fontes_str
+
+    @property
+    def links_str(self) -> str:
+        """Links das fontes separados por ponto-e-vírgula."""
+        if self._links_str is None:
+            self._links_str = "; ".join(self.links_fontes)
+        return self._links_str
 
     def to_excel_row(self) -> dict:
         """Converte o resultado para um dicionário compatível com Excel."""
@@ -42,12 +86,39 @@ class SoftwareResult(BaseModel):
             "Status Original": self.status_original or "",
             "Status Verificado": self.status_verificado,
             "Data Pesquisa": self.data_pesquisa.strftime("%Y-%m-%d %H:%M:%S"),
-            "Fontes": "; ".join(self.fontes_utilizadas) if self.fontes_utilizadas else "",
-            "Links": "; ".join(self.links_fontes) if self.links_fontes else "",
+            "Fontes": self.fontes_str,
+            "Links": self.links_str,
             "Confiança": self.nivel_confianca,
             "Resumo": self.resumo_pesquisa or "",
         }
 
+    def to_excel_tuple(self) -> tuple:
+        """Converte o resultado para uma linha do Excel, na ordem das colunas de saída."""
+        return (
+            self.nome,
+            self.versao or "",
+            self.status_original or "",
+            self.status_verificado,
+            self.data_pesquisa,
+            self.fontes_str,
+            self.links_str,
+            self.nivel_confianca,
+            self.resumo_pesquisa or "",
+        )
+
+    def copy_for(self, software: Software) -> "SoftwareResult":
+        """Cria uma cópia do resultado com os dados originais de outra linha do mesmo software."""
+        copy = replace(
+            self,
+            nome=software.nome,
+            versao=software.versao,
+            status_original=software.status_original,
+        )
+        # As cópias compartilham as listas, então reaproveitam os textos unidos uma única vez
+        copy._fontes_str = self.fontes_str
+        copy._links_str = self.links_str
+        return copy
+
     @classmethod
     def from_software(cls, software: Software, **kwargs) -> "SoftwareResult":
         """Cria um SoftwareResult a partir de um Software."""
@@ -58,3 +129,53 @@ class SoftwareResult(BaseModel):
             **kwargs,
         )
 
+    @classmethod
+    def from_raw(
+        cls,
+        software: Software,
+        status_verificado: Any,
+        nivel_confianca: Any,
+        fontes_utilizadas: Any = (),
+        links_fontes: Any = (),
+        resumo_pesquisa: Any = None,
+        data_pesquisa: Any = None,
+    ) -> "SoftwareResult":
+        """
+        Cria um SoftwareResult validando dados de origem externa.
+
+        Textos têm removidos os caracteres de controle que não podem ser gravados
+        no Excel, para que o resultado seja aceito por qualquer engine e pelo cache.
+
+        Args:
+            software: Software original
+            status_verificado: Status verificado
+            nivel_confianca: Nível de confiança (0-100)
+            fontes_utilizadas: Lista de fontes utilizadas
+            links_fontes: Lista de links das fontes
+            resumo_pesquisa: Resumo da pesquisa realizada
+            data_pesquisa: Data da pesquisa (datetime ou string ISO); agora se não fornecida
+
+        Returns:
+            SoftwareResult validado
+
+        Raises:
+            ValueError: Se o nível de confiança estiver fora do intervalo 0-100
+        """
+        nivel_confianca = int(nivel_confianca)
+        if not 0 <= nivel_confianca <= 100:
+            raise ValueError(f"Nível de confiança fora do intervalo 0-100: {nivel_confianca}")
+
+        if data_pesquisa is None:
+            data_pesquisa = datetime.now()
+        elif isinstance(data_pesquisa, str):
+            data_pesquisa = datetime.fromisoformat(data_pesquisa)
+
+        return cls.from_software(
+            software,
+            status_verificado=str(status_verificado),
+            nivel_confianca=nivel_confianca,
+            data_pesquisa=data_pesquisa,
+            fontes_utilizadas=[_clean_text(fonte) for fonte in fontes_utilizadas],
+            links_fontes=[_clean_text(link) for link in links_fontes],
+            resumo_pesquisa=_clean_text(resumo_pesquisa) if resumo_pesquisa is not None else None,
+        )
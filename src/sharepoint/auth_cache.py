@@ -0,0 +1,103 @@
+"""Cache em disco dos cookies de autenticação do SharePoint."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Diretório padrão do cache, fora do projeto para não ser versionado por engano
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "sharepoint_client"
+
+
+class AuthCookieCache:
+    """
+    Guarda o cabeçalho Cookie de uma sessão autenticada, com validade.
+
+    O arquivo é criado com permissão 0600 (somente o próprio usuário lê),
+    pois os cookies dão acesso ao SharePoint enquanto forem válidos.
+    """
+
+    def __init__(self, ttl_seconds: int, cache_dir: Path = DEFAULT_CACHE_DIR):
+        """
+        Inicializa o cache.
+
+        Args:
+            ttl_seconds: Tempo de validade dos cookies em segundos
+            cache_dir: Diretório onde os arquivos de cookies são armazenados
+        """
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+
+    def _path_for(self, site_url: str, username: str) -> Path:
+        """
+        Calcula o arquivo de cookies de um usuário em um site.
+
+        Args:
+            site_url: URL completa do site
+            username: Usuário autenticado
+
+        Returns:
+            Caminho do arquivo de cookies
+        """
+        digest = hashlib.sha1(f"{site_url}|{username}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.token"
+
+    def get(self, site_url: str, username: str) -> Optional[str]:
+        """
+        Busca cookies válidos no cache.
+
+        Args:
+            site_url: URL completa do site
+            username: Usuário autenticado
+
+        Returns:
+            Cabeçalho Cookie ou None se não houver entrada válida
+        """
+        path = self._path_for(site_url, username)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Cache de autenticação inválido, ignorando: {e}")
+            return None
+
+        if data.get("expires_at", 0) <= time.time():
+            return None
+        return data.get("cookie") or None
+
+    def set(self, site_url: str, username: str, cookie: str) -> None:
+        """
+        Armazena os cookies de uma sessão autenticada.
+
+        Args:
+            site_url: URL completa do site
+            username: Usuário autenticado
+            cookie: Cabeçalho Cookie da sessão
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        path = self._path_for(site_url, username)
+        payload = json.dumps({"cookie": cookie, "expires_at": time.time() + self.ttl_seconds})
+
+        try:
+            # Cria o arquivo já com permissão restrita, sem janela em que outros possam lê-lo
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o cache de autenticação: {e}")
+
+    def clear(self, site_url: str, username: str) -> None:
+        """
+        Remove os cookies de um usuário em um site.
+
+        Args:
+            site_url: URL completa do site
+            username: Usuário autenticado
+        """
+        self._path_for(site_url, username).unlink(missing_ok=True)
@@ -1,17 +1,48 @@
 """Cliente para integração com SharePoint."""
 
 import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from office365.sharepoint.client_context import ClientContext
+from office365.runtime.auth.authentication_context import AuthenticationContext
 from office365.runtime.auth.user_credential import UserCredential
 
 from src.config.settings import settings
+from src.sharepoint.auth_cache import AuthCookieCache
 
 logger = logging.getLogger(__name__)
 
+# Tamanho dos blocos lidos da resposta HTTP ao baixar arquivos; o buffer de
+# escrita do arquivo local usa o mesmo tamanho, para uma escrita por bloco
+_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Espera máxima entre tentativas, em segundos
+_MAX_BACKOFF = 30
+
+# Número máximo de downloads simultâneos em download_files
+_MAX_DOWNLOAD_WORKERS = 8
+
+
+class _CookieAuthContext(AuthenticationContext):
+    """Contexto de autenticação que reaproveita os cookies de uma sessão anterior."""
+
+    def __init__(self, url: str, cookie: str):
+        """
+        Args:
+            url: URL completa do site
+            cookie: Cabeçalho Cookie de uma sessão autenticada
+        """
+        super().__init__(url)
+        self._cookie = cookie
+
+    def authenticate_request(self, request) -> None:
+        """Envia os cookies em cache, sem o handshake de login."""
+        request.set_header("Cookie", self._cookie)
+
 
 class SharePointClient:
     """Cliente para autenticação e download de arquivos do SharePoint."""
@@ -38,6 +69,9 @@ class SharePointClient:
         self.password = password or settings.sharepoint_password
         self.ctx: Optional[ClientContext] = None
 
+        ttl_minutes = settings.sharepoint_auth_cache_minutes
+        self.auth_cache = AuthCookieCache(ttl_minutes * 60) if ttl_minutes > 0 else None
+
     def authenticate(self, max_retries: Optional[int] = None) -> bool:
         """
         Autentica no SharePoint com retry e backoff.
@@ -48,29 +82,67 @@ class SharePointClient:
         Returns:
             True se autenticação bem-sucedida, False caso contrário
         """
-        max_retries = max_retries or settings.max_retries
+        site_url = f"{self.url}{self.site}"
+        if self._authenticate_from_cache(site_url):
+            return True
 
-        for attempt in range(1, max_retries + 1):
-            try:
-                logger.info(f"Tentando autenticar no SharePoint (tentativa {attempt}/{max_retries})...")
-                site_url = f"{self.url}{self.site}"
-                credentials = UserCredential(self.username, self.password)
-                self.ctx = ClientContext(site_url).with_credentials(credentials)
-                # Testa a conexão
-                self.ctx.web.get().execute_query()
-                logger.info("Autenticação no SharePoint bem-sucedida")
-                return True
-            except Exception as e:
-                logger.warning(f"Erro na autenticação (tentativa {attempt}/{max_retries}): {e}")
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt  # Backoff exponencial
-                    logger.info(f"Aguardando {wait_time} segundos antes de tentar novamente...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Falha na autenticação do SharePoint após todas as tentativas")
-                    return False
+        # O contexto é criado uma única vez e reaproveitado entre as tentativas
+        credentials = UserCredential(self.username, self.password)
+        ctx = ClientContext(site_url).with_credentials(credentials)
 
-        return False
+        # Guarda o cabeçalho Cookie gerado pelo login para reaproveitá-lo em execuções futuras
+        session: dict[str, str] = {}
+
+        def capture_cookie(request) -> None:
+            cookie = request.headers.get("Cookie")
+            if cookie:
+                session["cookie"] = cookie
+
+        ctx.pending_request().beforeExecute += capture_cookie
+
+        def connect() -> None:
+            # Testa a conexão
+            ctx.web.get().execute_query()
+            self.ctx = ctx
+
+        if not self._retry(connect, "autenticar no SharePoint", max_retries):
+            return False
+
+        if self.auth_cache is not None and session.get("cookie"):
+            self.auth_cache.set(site_url, self.username, session["cookie"])
+
+        logger.info("Autenticação no SharePoint bem-sucedida")
+        return True
+
+    def _authenticate_from_cache(self, site_url: str) -> bool:
+        """
+        Tenta autenticar com os cookies de uma execução anterior.
+
+        Args:
+            site_url: URL completa do site
+
+        Returns:
+            True se os cookies em cache ainda são aceitos pelo SharePoint
+        """
+        if self.auth_cache is None:
+            return False
+
+        cookie = self.auth_cache.get(site_url, self.username)
+        if cookie is None:
+            return False
+
+        ctx = ClientContext(site_url, auth_context=_CookieAuthContext(site_url, cookie))
+        try:
+            # Consulta leve apenas para validar a sessão
+            ctx.web.get().select(["Title"]).execute_query()
+        except Exception as e:
+            logger.info(f"Cookies de autenticação em cache não são mais válidos: {e}")
+            self.auth_cache.clear(site_url, self.username)
+            return False
+
+        self.ctx = ctx
+        logger.info("Autenticação no SharePoint reaproveitada do cache")
+        return True
 
     def download_file(
         self,
@@ -95,37 +167,124 @@ class SharePointClient:
             logger.error("Cliente não autenticado. Chame authenticate() primeiro.")
             return False
 
+        return self._download_file(self.ctx, library_name, file_name, local_path, max_retries)
+
+    def download_files(
+        self,
+        items: list[tuple[str, str, Path]],
+        max_retries: Optional[int] = None,
+    ) -> dict[Path, bool]:
+        """
+        Baixa vários arquivos do SharePoint em paralelo.
+
+        Args:
+            items: Tuplas (biblioteca, nome do arquivo, caminho local) a baixar
+            max_retries: Número máximo de tentativas por arquivo (usa settings se não fornecido)
+
+        Returns:
+            Dicionário caminho local -> True se o download foi bem-sucedido
+
+        Raises:
+            ValueError: Se dois itens tiverem o mesmo caminho local
+        """
+        # Cada download grava no próprio caminho local; dois itens no mesmo caminho
+        # escreveriam o mesmo arquivo temporário ao mesmo tempo
+        local_paths = [local_path for _, _, local_path in items]
+        if len({local_path.resolve() for local_path in local_paths}) != len(local_paths):
+            raise ValueError("Caminhos locais repetidos em download_files")
+
+        if not self.ctx:
+            logger.error("Cliente não autenticado. Chame authenticate() primeiro.")
+            return {local_path: False for local_path in local_paths}
+
+        def download(item: tuple[str, str, Path]) -> bool:
+            # A fila de consultas do ClientContext não é thread-safe: cada download usa
+            # o próprio contexto, compartilhando a autenticação já realizada
+            ctx = ClientContext(self.ctx.base_url, auth_context=self.ctx.authentication_context)
+            return self._download_file(ctx, *item, max_retries)
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_DOWNLOAD_WORKERS, len(items) or 1)) as executor:
+            results = executor.map(download, items)
+            return dict(zip(local_paths, results))
+
+    def _download_file(
+        self,
+        ctx: ClientContext,
+        library_name: str,
+        file_name: str,
+        local_path: Path,
+        max_retries: Optional[int] = None,
+    ) -> bool:
+        """
+        Baixa um arquivo usando o contexto informado.
+
+        Args:
+            ctx: Contexto autenticado do SharePoint
+            library_name: Nome da biblioteca de documentos
+            file_name: Nome do arquivo
+            local_path: Caminho local onde salvar o arquivo
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            True se download bem-sucedido, False caso contrário
+        """
+
+        def download() -> None:
+            # Descarta consultas que uma tentativa anterior com falha deixou na fila
+            ctx.clear()
+
+            # Garante que o diretório existe
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Obtém a biblioteca de documentos
+            library = ctx.web.lists.get_by_title(library_name)
+            # Obtém o arquivo
+            file = library.root_folder.files.get_by_url(file_name)
+            # Baixa o conteúdo em blocos para um arquivo temporário ao lado do destino;
+            # o destino só é substituído com o download completo, nunca por um arquivo truncado
+            part_path = local_path.with_name(f"{local_path.name}.part")
+            try:
+                with open(part_path, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                    file.download_session(f, chunk_size=_DOWNLOAD_CHUNK_SIZE).execute_query()
+                part_path.replace(local_path)
+            finally:
+                part_path.unlink(missing_ok=True)
+
+        if not self._retry(download, f"baixar o arquivo {file_name}", max_retries):
+            return False
+
+        logger.info(f"Arquivo baixado com sucesso: {local_path}")
+        return True
+
+    @staticmethod
+    def _retry(fn: Callable[[], None], desc: str, max_retries: Optional[int] = None) -> bool:
+        """
+        Executa uma operação com retry e backoff exponencial limitado, com jitter.
+
+        Args:
+            fn: Operação a executar; qualquer exceção conta como falha da tentativa
+            desc: Descrição da operação para os logs (ex: "baixar o arquivo X")
+            max_retries: Número máximo de tentativas (usa settings se não fornecido)
+
+        Returns:
+            True se alguma tentativa foi bem-sucedida, False caso contrário
+        """
         max_retries = max_retries or settings.max_retries
 
         for attempt in range(1, max_retries + 1):
             try:
-                logger.info(f"Baixando arquivo {file_name} (tentativa {attempt}/{max_retries})...")
-                # Garante que o diretório existe
-                local_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Obtém a biblioteca de documentos
-                library = self.ctx.web.lists.get_by_title(library_name)
-                # Obtém o arquivo
-                file = library.root_folder.files.get_by_url(file_name)
-                # Baixa o conteúdo
-                file_content = file.get_content().execute_query()
-
-                # Salva localmente
-                with open(local_path, "wb") as f:
-                    f.write(file_content.value)
-
-                logger.info(f"Arquivo baixado com sucesso: {local_path}")
+                logger.info(f"Tentando {desc} (tentativa {attempt}/{max_retries})...")
+                fn()
                 return True
             except Exception as e:
-                logger.warning(f"Erro ao baixar arquivo (tentativa {attempt}/{max_retries}): {e}")
+                logger.warning(f"Erro ao {desc} (tentativa {attempt}/{max_retries}): {e}")
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    logger.info(f"Aguardando {wait_time} segundos antes de tentar novamente...")
+                    # Jitter evita que execuções em paralelo repitam as tentativas juntas
+                    wait_time = min(_MAX_BACKOFF, 2 ** attempt) * (0.5 + random.random())
+                    logger.info(f"Aguardando {wait_time:.1f} segundos antes de tentar novamente...")
                     time.sleep(wait_time)
-                else:
-                    logger.error("Falha ao baixar arquivo após todas as tentativas")
-                    return False
 
+        logger.error(f"Falha ao {desc} após todas as tentativas")
         return False
 
     def download_excel_file(
@@ -0,0 +1,52 @@
+"""Controle de taxa de requisições compartilhado entre threads e corrotinas."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Limitador de taxa do tipo token bucket, seguro para uso entre threads e no asyncio."""
+
+    def __init__(self, rate_per_sec: float, capacity: int):
+        """
+        Inicializa o limitador com o balde cheio.
+
+        Args:
+            rate_per_sec: Taxa de reposição de tokens (requisições por segundo)
+            capacity: Número máximo de tokens acumulados (tamanho da rajada)
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Consome um token, bloqueando apenas enquanto não houver tokens disponíveis."""
+        while (wait_time := self._try_acquire()) > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self) -> None:
+        """Consome um token, aguardando sem bloquear o event loop quando não houver tokens."""
+        while (wait_time := self._try_acquire()) > 0:
+            await asyncio.sleep(wait_time)
+
+    def _try_acquire(self) -> float:
+        """
+        Tenta consumir um token.
+
+        Returns:
+            0 se o token foi consumido, ou o tempo em segundos até o próximo token
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_sec)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+
+            return (1 - self._tokens) / self.rate_per_sec